@@ -2,7 +2,7 @@
 from __future__ import division, print_function
 import numpy as np
 
-from .utils import safe_inverse
+from .utils import safe_inverse, safe_divide
 
 
 class Mixer(object):
@@ -35,6 +35,10 @@ class Mixer(object):
         self.cEff_inv = safe_inverse(self.cEff)
         # Mixing Matrix
         self.Mij = np.zeros(dims)
+        # Buffers for intermediate arrays reused at each smear step
+        dtype = np.result_type(response, efficiencies, data, float)
+        self._f_norm = np.empty(self.ebins, dtype=dtype)
+        self._n_c_eff = np.empty(self.cbins, dtype=dtype)
 
         self.cov = CovarianceMatrix(data=data,
                                     data_err=data_err,
@@ -53,15 +57,15 @@ class Mixer(object):
     def get_stat_err(self):
         """Statistical Errors
         """
-        cvm = self.cov.getVc0()
-        err = np.sqrt(cvm.diagonal())
+        var = self.cov.getVc0_diag()
+        err = np.sqrt(var)
         return err
 
     def get_MC_err(self):
         """MC (Systematic) Errors
         """
-        cvm = self.cov.getVc1()
-        err = np.sqrt(cvm.diagonal())
+        var = self.cov.getVc1_diag()
+        err = np.sqrt(var)
         return err
 
     def smear(self, n_c):
@@ -76,12 +80,12 @@ class Mixer(object):
             raise ValueError(err_msg)
 
         # Bayesian Normalization Term (denominator)
-        f_norm = np.dot(self.pec, n_c)
-        f_inv = safe_inverse(f_norm)
-        n_c_eff = n_c * self.cEff_inv
+        f_norm = np.matmul(self.pec, n_c, out=self._f_norm)
+        n_c_eff = np.multiply(n_c, self.cEff_inv, out=self._n_c_eff)
 
-        # Unfolding (Mij) Matrix at current step
-        Mij = self.pec * n_c_eff * f_inv.reshape(-1, 1)
+        # Unfolding (Mij) Matrix at current step. Note that a new Mij is
+        # allocated at each step, as it's returned as the unfolding matrix.
+        Mij = safe_divide(self.pec * n_c_eff, f_norm.reshape(-1, 1))
 
         # Estimate cause distribution via Mij
         n_c_update = np.dot(self.NEobs, Mij)
@@ -111,13 +115,10 @@ class CovarianceMatrix(object):
         self.cEff = efficiencies
         self.cEff_inv = safe_inverse(self.cEff)
         # Effective number of sim events
-        efficiencies_err_inv = safe_inverse(efficiencies_err)
-        NCmc = (efficiencies * efficiencies_err_inv)**2
+        NCmc = safe_divide(efficiencies, efficiencies_err)**2
         self.NCmc = NCmc
         self.NEobs = data
         self.NEobs_err = data_err
-        # Total number of observed effects
-        self.nobs = np.sum(self.NEobs)
 
         # Number of cause and effect eins
         dims = self.pec.shape
@@ -134,10 +135,11 @@ class CovarianceMatrix(object):
         """
         # D'Agostini Form (and/or First Term of Adye)
         dcdP = self._initialize_dcdP(Mij, f_norm, n_c, n_c_prev)
-        dcdn = Mij.copy()
         # Add Adye propagation corrections
         if self.counter > 0:
             dcdn, dcdP = self._adye_propagation_corrections(dcdP, Mij, n_c, n_c_prev)
+        else:
+            dcdn = Mij.copy()
 
         # Set current derivative matrices
         self.dcdn = dcdn
@@ -149,21 +151,19 @@ class CovarianceMatrix(object):
         cbins = self.cbins
         ebins = self.ebins
 
-        NE_F_R = self.NEobs * safe_inverse(f_norm)
+        NE_F_R = safe_divide(self.NEobs, f_norm)
 
-        dcdP = np.zeros((cbins, cbins * ebins))
-        # (ti, ec_j + tk) elements
-        tk = np.arange(0, cbins)
-        for ej in np.arange(0, ebins):
-            A = np.outer(-NE_F_R[ej] * Mij[ej, :], n_c_prev)
-            for ti in np.arange(0, cbins):
-                dcdP[ti, ej * cbins + tk] = A[ti, tk]
+        # dcdP is filled as a (ti, ej, tk) array, where the (ti, ej, tk)
+        # element corresponds to the (ti, ec_j + tk) element of dcdP
+        dcdP = np.einsum('e,et,k->tek', -NE_F_R, Mij, n_c_prev, order='C')
 
-        # (ti, ec_j + ti) elements
-        ti = np.arange(0, cbins)
+        # (ti, ec_j + ti) elements, updated through a writeable (ti, ej)
+        # diagonal view of dcdP
         A = (np.outer(n_c_prev, NE_F_R) - n_c[:, None]) * self.cEff_inv[:, None]
-        for ej in np.arange(0, ebins):
-            dcdP[ti, ej * cbins + ti] += A[ti, ej]
+        dcdP_diag = np.einsum('tet->te', dcdP)
+        dcdP_diag += A
+
+        dcdP = dcdP.reshape(cbins, cbins * ebins)
 
         return dcdP
 
@@ -174,33 +174,36 @@ class CovarianceMatrix(object):
         dcdn_prev = self.dcdn
         dcdP_prev = self.dcdP
 
-        n_c_prev_inv = safe_inverse(n_c_prev)
         # Ratio of updated n_c to n_c_prev
-        nc_r = n_c * n_c_prev_inv
+        nc_r = safe_divide(n_c, n_c_prev)
         # Efficiency ratio of n_c_prev
-        e_r = self.cEff * n_c_prev_inv
+        e_r = safe_divide(self.cEff, n_c_prev)
+
+        # Mij scaled by efficiency ratio, shared by dcdn and dcdP terms
+        B = Mij * e_r
 
         # Calculate extra dcdn terms
         M1 = dcdn_prev * nc_r
-        M2 = -Mij * e_r
-        M2 = M2.T * self.NEobs
-        M3 = np.dot(M2, dcdn_prev)
-        dcdn += np.dot(Mij, M3)
+        M2 = -B.T * self.NEobs
+        # multi_dot picks the cheapest multiplication order for the
+        # given numbers of cause and effect bins
+        dcdn += np.linalg.multi_dot([Mij, M2, dcdn_prev])
         dcdn += M1
 
         # Calculate extra dcdP terms (from unfolding doc)
         At = Mij.T * self.NEobs
-        B = Mij * e_r
-        C = np.dot(At, B)
-        dcdP_Upd = np.dot(C, dcdP_prev)
-        dcdP += (dcdP_prev.T * nc_r).T - dcdP_Upd
+        dcdP_Upd = np.linalg.multi_dot([At, B, dcdP_prev])
+        dcdP += dcdP_prev * nc_r[:, None] - dcdP_Upd
 
         return dcdn, dcdP
 
     def getVcd(self):
-        """Get Covariance Matrix of N(E), ie from Observed Effects
+        """Get Variances of N(E), ie from Observed Effects
+
+        The covariance matrix of N(E) is diagonal, so only its diagonal
+        is returned.
         """
-        Vcd = np.diag(self.NEobs_err**2)
+        Vcd = self.NEobs_err**2
         return Vcd
 
     def getVc0(self):
@@ -208,13 +211,25 @@ class CovarianceMatrix(object):
         """
         # Get derivative
         dcdn = self.dcdn
-        # Get NObs covariance
+        # Get NObs variances
         Vcd = self.getVcd()
-        # Set data covariance
-        Vc0 = dcdn.T.dot(Vcd).dot(dcdn)
+        # Set data covariance (equivalent to dcdn.T @ diag(Vcd) @ dcdn)
+        Vc0 = dcdn.T.dot(dcdn * Vcd[:, None])
 
         return Vc0
 
+    def getVc0_diag(self):
+        """Get diagonal of Vc0 (data) contribution to cov matrix
+        """
+        # Get derivative
+        dcdn = self.dcdn
+        # Get NObs variances
+        Vcd = self.getVcd()
+        # Diagonal of dcdn.T @ diag(Vcd) @ dcdn, without the full matrix
+        Vc0_diag = np.dot(Vcd, dcdn**2)
+
+        return Vc0_diag
+
     def getVcPP(self):
         """Get Covariance Matrix of P(E|C), ie from MC
         """
@@ -231,17 +246,43 @@ class CovarianceMatrix(object):
 
         return CovPP
 
+    def getVcPP_diag(self):
+        """Get diagonal of the (Poisson) Covariance Matrix of P(E|C)
+        """
+        CovPP_diag = poisson_variance(self.pec_err)
+        return CovPP_diag
+
     def getVc1(self):
         """Get full Vc1 (MC) contribution to cov matrix
         """
-        # Get NObs covariance
-        CovPP = self.getVcPP()
         # Get derivative
         dcdP = self.dcdP
-        # Set MC covariance
-        Vc1 = dcdP.dot(CovPP).dot(dcdP.T)
+        if self.pec_cov_type == 'poisson':
+            # Diagonal P(E|C) covariance, equivalent to
+            # dcdP @ diag(CovPP_diag) @ dcdP.T
+            CovPP_diag = self.getVcPP_diag()
+            Vc1 = (dcdP * CovPP_diag).dot(dcdP.T)
+        else:
+            # Get NObs covariance
+            CovPP = self.getVcPP()
+            # Set MC covariance
+            Vc1 = dcdP.dot(CovPP).dot(dcdP.T)
         return Vc1
 
+    def getVc1_diag(self):
+        """Get diagonal of Vc1 (MC) contribution to cov matrix
+        """
+        # Get derivative
+        dcdP = self.dcdP
+        # Diagonal of dcdP @ CovPP @ dcdP.T, without the full matrix
+        if self.pec_cov_type == 'poisson':
+            CovPP_diag = self.getVcPP_diag()
+            Vc1_diag = np.dot(dcdP**2, CovPP_diag)
+        else:
+            CovPP = self.getVcPP()
+            Vc1_diag = np.einsum('ij,ij->i', dcdP.dot(CovPP), dcdP)
+        return Vc1_diag
+
     def get_cov(self):
         """Get full covariance matrix
         """
@@ -253,27 +294,32 @@ class CovarianceMatrix(object):
         return Vc
 
 
+def poisson_variance(pec_err):
+    # Diagonal of the Poisson covariance matrix, with the (ej, ti) element
+    # at index ej * cbins + ti
+    return np.ravel(pec_err)**2
+
+
 def poisson_covariance(ebins, cbins, pec_err):
     # Poisson covariance matrix
-    CovPP = np.zeros((cbins * ebins, cbins * ebins))
-    for ej in np.arange(0, ebins):
-        ejc = ej * cbins
-        for ti in np.arange(0, cbins):
-            CovPP[ejc+ti, ejc+ti] = pec_err[ej, ti]**2
+    CovPP = np.diag(poisson_variance(pec_err))
 
     return CovPP
 
 
 def multinomial_covariance(ebins, cbins, nc_inv, pec):
     CovPP = np.zeros((cbins * ebins, cbins * ebins))
+    # Covariance between the (ej, ti) and (ek, ti) elements of P(E|C),
+    # stored as an (ej, ek, ti) array
+    cov = -nc_inv * pec[:, None, :] * pec
+    # Symmetric in (ej, ek), fill the lower triangle from the upper one
+    ej, ek = np.triu_indices(ebins, 1)
+    cov[ek, ej] = cov[ej, ek]
+    # (ej, ti, ej, ti) elements
+    e = np.arange(0, ebins)
+    cov[e, e] = nc_inv * pec * (1 - pec)
+    # Scatter into the (ej * cbins + ti, ek * cbins + ti) elements
     ti = np.arange(0, cbins)
-    A = nc_inv * pec * (1 - pec)
-    for ej in np.arange(0, ebins):
-        ejc = ej * cbins
-        CovPP[ejc+ti, ejc+ti] = A[ej]
-        cov = -nc_inv * pec[ej, :] * pec
-        for ek in np.arange(ej + 1, ebins):
-            CovPP[ejc + ti, ek * cbins + ti] = cov[ek, :]
-            CovPP[ek * cbins + ti, ejc + ti] = cov[ek, :]
+    CovPP.reshape(ebins, cbins, ebins, cbins)[:, ti, :, ti] = cov.transpose(2, 0, 1)
 
     return CovPP
@@ -86,3 +86,46 @@ def test_mixer_2d_response_check():
     raised_msg = str(excinfo.value)
     assert 'Response matrix must be 2-dimensional' in raised_msg
     assert '{}-dimensional response'.format(response_bad.ndim) in raised_msg
+
+
+def smeared_mixer(cov_type, num_iterations=2):
+    # Mixer after a few unfolding iterations. From the second iteration on,
+    # the Adye propagation corrections are included.
+    mixer = Mixer(data=data,
+                  data_err=data_err,
+                  efficiencies=efficiencies,
+                  efficiencies_err=efficiencies_err,
+                  response=response,
+                  response_err=response_err,
+                  cov_type=cov_type)
+    n_c = np.full(num_causes, data.sum() / num_causes)
+    for _ in range(num_iterations):
+        n_c = mixer.smear(n_c)
+    return mixer
+
+
+@pytest.mark.parametrize('cov_type', ['multinomial', 'poisson'])
+def test_covariance_diag(cov_type):
+    cov = smeared_mixer(cov_type).cov
+
+    np.testing.assert_allclose(cov.getVc0_diag(), cov.getVc0().diagonal())
+    np.testing.assert_allclose(cov.getVc1_diag(), cov.getVc1().diagonal())
+    # Vc1 should match the explicit product with the full P(E|C) covariance
+    np.testing.assert_allclose(cov.getVc1(),
+                               cov.dcdP.dot(cov.getVcPP()).dot(cov.dcdP.T))
+
+
+def test_mixer_smear_buffers_keep_dtype():
+    # Intermediate smear buffers shouldn't round extended precision inputs
+    dtype = np.longdouble
+    mixer = Mixer(data=data.astype(dtype),
+                  data_err=data_err.astype(dtype),
+                  efficiencies=efficiencies.astype(dtype),
+                  efficiencies_err=efficiencies_err.astype(dtype),
+                  response=response.astype(dtype),
+                  response_err=response_err.astype(dtype))
+    n_c = mixer.smear(np.full(num_causes, data.sum() / num_causes, dtype=dtype))
+
+    assert n_c.dtype == dtype
+    assert mixer._f_norm.dtype == dtype
+    assert mixer._n_c_eff.dtype == dtype
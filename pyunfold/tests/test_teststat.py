@@ -1,5 +1,6 @@
 
 import pytest
+import numpy as np
 
 from pyunfold.teststat import get_ts, TEST_STATISTICS
 
@@ -28,3 +29,51 @@ def test_ts_calc(ts, example_dataset):
                      TestRange=[0, 1e2],
                      verbose=False)
     ts_func.calc(example_dataset.data, example_dataset.data + 1)
+
+
+@pytest.mark.parametrize('ts', TEST_STATISTICS.keys())
+def test_ts_calc_does_not_modify_inputs(ts):
+    dist1 = np.array([0.2, 0., 10., 5., 0.7])
+    dist2 = np.array([0., 0.5, 12., 4., 1.])
+    dist1_original = dist1.copy()
+    dist2_original = dist2.copy()
+
+    ts_func = get_ts(ts)(tol=0.01, num_causes=len(dist1))
+    ts_func.calc(dist1, dist2)
+
+    np.testing.assert_array_equal(dist1, dist1_original)
+    np.testing.assert_array_equal(dist2, dist2_original)
+
+
+@pytest.mark.parametrize('ts', TEST_STATISTICS.keys())
+def test_ts_no_instance_dict(ts):
+    ts_func = get_ts(ts)(tol=0.01, num_causes=5)
+    assert not hasattr(ts_func, '__dict__')
+
+
+@pytest.mark.parametrize('x', [-np.inf, -3., 0., 0.5, 0.7, 1.5, 2., 4.5, 4.51,
+                               10., np.inf])
+def test_cause_axis_index(x):
+    ts_func = get_ts('ks')(tol=0.01, num_causes=5)
+    assert ts_func._cause_axis_index(x) == np.searchsorted(ts_func.cause_axis, x)
+
+
+@pytest.mark.parametrize('ts', TEST_STATISTICS.keys())
+def test_ts_calc_reuses_scratch(ts):
+    dist1 = np.array([1., 2., 3., 4.])
+    dist2 = np.array([2., 2., 3., 1.])
+    ts_func = get_ts(ts)(tol=0.01, num_causes=len(dist1))
+    stat = ts_func.calc(dist1, dist2)
+    scratch = dict(ts_func._scratch)
+    assert ts_func.calc(dist1, dist2) == stat
+    for name, buf in ts_func._scratch.items():
+        assert buf is scratch[name]
+
+    # Scratch buffers are reallocated when the input shape changes
+    dist1_short = np.array([5., 0.2, 7.])
+    dist2_short = np.array([3., 0.5, 9.])
+    stat_short = ts_func.calc(dist1_short, dist2_short)
+    ts_fresh = get_ts(ts)(tol=0.01, num_causes=len(dist1_short))
+    # Degrees of freedom are set on the first calc call
+    ts_fresh.set_dof(ts_func.dof)
+    np.testing.assert_allclose(stat_short, ts_fresh.calc(dist1_short, dist2_short))
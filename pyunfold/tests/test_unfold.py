@@ -49,6 +49,28 @@ def test_iterative_unfold(response_type):
         assert not np.allclose(counts, unfolded_counts)
 
 
+@pytest.mark.parametrize('dtype', [np.float32, np.longdouble])
+def test_iterative_unfold_dtype(dtype):
+    # Unfolding non-float64 inputs should match the float64 result
+    inputs = {'data': [100, 150],
+              'data_err': [10, 12.2],
+              'response': [[0.9, 0.1],
+                           [0.1, 0.9]],
+              'response_err': [[0.01, 0.01],
+                               [0.01, 0.01]],
+              'efficiencies': [1, 1],
+              'efficiencies_err': [0.01, 0.01]}
+    expected = iterative_unfold(**inputs)
+    inputs_dtype = {key: np.asarray(value, dtype=dtype)
+                    for key, value in inputs.items()}
+    result = iterative_unfold(**inputs_dtype)
+
+    assert result['unfolded'].dtype == np.result_type(dtype, float)
+    for key in ['unfolded', 'stat_err', 'sys_err']:
+        np.testing.assert_allclose(result[key].astype(float), expected[key],
+                                   rtol=1e-5)
+
+
 def test_iterative_unfold_max_iter():
     # Load test counts distribution and diagonal response matrix
     np.random.seed(2)
@@ -3,8 +3,8 @@ from __future__ import division, print_function
 import numpy as np
 import pytest
 
-from pyunfold.utils import (none_to_empty_list, safe_inverse, cast_to_array,
-                            assert_same_shape)
+from pyunfold.utils import (none_to_empty_list, safe_inverse, safe_divide,
+                            cast_to_array, assert_same_shape)
 
 
 def test_none_to_empty_list_single_input():
@@ -32,6 +32,21 @@ def test_safe_inverse(dtype):
             assert value != 0
 
 
+@pytest.mark.parametrize('dtype', [int, float])
+def test_safe_divide(dtype):
+    num = np.array([1, 2, 3, 4, 5], dtype=dtype)
+    den = np.array([1, 0, 3, 0, 5], dtype=dtype)
+    quot = safe_divide(num, den)
+    np.testing.assert_allclose(quot, [1, 0, 1, 0, 1])
+
+
+def test_safe_divide_broadcast():
+    num = np.ones((2, 3))
+    den = np.array([[2], [0]])
+    quot = safe_divide(num, den)
+    np.testing.assert_allclose(quot, [[0.5, 0.5, 0.5], [0, 0, 0]])
+
+
 def test_cast_to_array_multi_input():
     a_original = [1, 2, 3]
     b_original = np.array([4, 5, 6])
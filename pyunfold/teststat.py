@@ -9,6 +9,9 @@ from .utils import none_to_empty_list
 class TestStat(object):
     """Common base class for test statistic methods
     """
+    __slots__ = ('tol', 'cause_axis', 'ts_range', 'has_ts_range', 'ts_bins',
+                 'stat', 'dof', 'dofSet', '_scratch')
+
     def __init__(self, tol=None, num_causes=None, test_range=None, **kwargs):
         test_range = none_to_empty_list(test_range)
         self.tol = tol
@@ -25,6 +28,8 @@ class TestStat(object):
         self.stat = np.inf
         self.dof = -1
         self.dofSet = False
+        # Scratch arrays reused across calc calls
+        self._scratch = {}
 
     def set_test_range_bins(self):
         bins = [0, -1]
@@ -39,19 +44,40 @@ class TestStat(object):
             assert xlo < xhi, err_mess
 
             # Find the bins corresponding to the test range requested
-            lobin = np.searchsorted(self.cause_axis, xlo)
-            hibin = np.searchsorted(self.cause_axis, xhi)
+            lobin = self._cause_axis_index(xlo)
+            hibin = self._cause_axis_index(xhi)
             bins = [lobin, hibin]
             self.has_ts_range = True
         return bins
 
+    def _cause_axis_index(self, x):
+        """Index at which x would be inserted into the cause axis
+
+        Equivalent to ``np.searchsorted(self.cause_axis, x)``. Since cause
+        bin midpoints are spaced one unit apart, the index is computed
+        directly instead of searching the axis.
+        """
+        index = np.clip(np.ceil(x - self.cause_axis[0]), 0, len(self.cause_axis))
+        return int(index)
+
     def get_array_range(self, dist1, dist2):
+        # Note that no copies are made here. Test statistic calculations
+        # must treat the returned arrays as read-only.
         if self.has_ts_range:
             NR1 = dist1[self.ts_bins[0]:self.ts_bins[1]]
             NR2 = dist2[self.ts_bins[0]:self.ts_bins[1]]
             return NR1, NR2
         else:
-            return dist1.copy(), dist2.copy()
+            return dist1, dist2
+
+    def _get_scratch(self, name, shape):
+        """Returns a reusable scratch array for intermediate calculations
+        """
+        buf = self._scratch.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape)
+            self._scratch[name] = buf
+        return buf
 
     def pass_tol(self):
         """Function testing whether TS < tol
@@ -86,6 +112,8 @@ class TestStat(object):
 class Chi2(TestStat):
     """Reduced chi-squared test statistic
     """
+    __slots__ = ()
+
     def calc(self, dist1, dist2):
         """Calculate the test statistic between two input distributions
 
@@ -106,13 +134,16 @@ class Chi2(TestStat):
         n1 = np.sum(dist1)
         n2 = np.sum(dist2)
 
-        h_sum = dist1 + dist2
+        shape = np.shape(dist1)
         # Don't divide by 0...
-        h_sum[(h_sum < 1)] = 1.
-        h_dif = n2 * dist1 - n1 * dist2
-        h_quot = h_dif * h_dif / h_sum
-
-        stat = np.sum(h_quot)/(n1*n2)/self.dof
+        h_sum = np.add(dist1, dist2, out=self._get_scratch('sum', shape))
+        np.maximum(h_sum, 1., out=h_sum)
+        h_dif = np.multiply(dist1, n2, out=self._get_scratch('dif', shape))
+        h_dif -= np.multiply(dist2, n1, out=self._get_scratch('tmp', shape))
+        # sum(h_dif**2 / h_sum) as a single dot product reduction
+        h_quot = np.divide(h_dif, h_sum, out=h_sum)
+
+        stat = np.dot(h_dif, h_quot)/(n1*n2)/self.dof
         self.stat = stat
 
         return stat
@@ -132,6 +163,8 @@ class BF(TestStat):
         *The Astrophysical Journal* 738 (1):82.
         `<https://doi.org/10.1088/0004-637X/738/1/82>`_.
     """
+    __slots__ = ()
+
     def calc(self, dist1, dist2):
         """Calculate the test statistic between two input distributions
 
@@ -149,14 +182,23 @@ class BF(TestStat):
         """
         dist1, dist2 = self.get_array_range(dist1, dist2)
         self.check_lengths(dist1, dist2)
-        lnB = 0
+        dist1 = np.asarray(dist1, dtype=np.float64)
+        dist2 = np.asarray(dist2, dtype=np.float64)
         n1 = np.sum(dist1)
         n2 = np.sum(dist2)
         nFactor = lgamma(n1+n2+2) - lgamma(n1+1) - lgamma(n2+1)
 
-        lnB += nFactor
-        for i in range(0, len(dist1)):
-            lnB += lgamma(dist1[i]+1) + lgamma(dist2[i]+1) - lgamma(dist1[i]+dist2[i]+2)
+        shape = np.shape(dist1)
+        # Vectorized over all bins, rather than looping over each bin.
+        # Per-bin terms are accumulated in place in the scratch buffers.
+        terms = np.add(dist1, 1, out=self._get_scratch('terms', shape))
+        lgamma(terms, out=terms)
+        buf = np.add(dist2, 1, out=self._get_scratch('tmp', shape))
+        terms += lgamma(buf, out=buf)
+        np.add(dist1, dist2, out=buf)
+        buf += 2
+        terms -= lgamma(buf, out=buf)
+        lnB = nFactor + np.sum(terms)
 
         self.stat = lnB
 
@@ -166,6 +208,8 @@ class BF(TestStat):
 class RMD(TestStat):
     """Maximum relative difference test statistic
     """
+    __slots__ = ()
+
     def calc(self, dist1, dist2):
         """Calculate the test statistic between two input distributions
 
@@ -184,10 +228,13 @@ class RMD(TestStat):
         dist1, dist2 = self.get_array_range(dist1, dist2)
         self.check_lengths(dist1, dist2)
 
-        h_sum = dist1+dist2
-        h_sum[(h_sum < 1)] = 1.
-        h_dif = np.abs(dist1 - dist2)
-        h_quot = h_dif / h_sum
+        shape = np.shape(dist1)
+        # Don't divide by 0...
+        h_sum = np.add(dist1, dist2, out=self._get_scratch('sum', shape))
+        np.maximum(h_sum, 1., out=h_sum)
+        h_dif = np.subtract(dist1, dist2, out=self._get_scratch('dif', shape))
+        np.abs(h_dif, out=h_dif)
+        h_quot = np.divide(h_dif, h_sum, out=h_sum)
         stat = np.max(h_quot)
         self.stat = stat
 
@@ -197,6 +244,8 @@ class RMD(TestStat):
 class KS(TestStat):
     """Kolmogorov-Smirnov (KS) two-sided test statistic
     """
+    __slots__ = ('en',)
+
     def calc(self, dist1, dist2):
         """Calculate the test statistic between two input distributions
 
@@ -217,12 +266,16 @@ class KS(TestStat):
 
         n1 = np.sum(dist1)
         n2 = np.sum(dist2)
-        cs1 = np.cumsum(dist1)/n1
-        cs2 = np.cumsum(dist2)/n2
+        shape = np.shape(dist1)
+        # Difference of the cumulative distributions, computed with a single
+        # cumulative sum. Normalization by n1 * n2 is applied once at the end.
+        cs_dif = np.multiply(dist1, n2, out=self._get_scratch('dif', shape))
+        cs_dif -= np.multiply(dist2, n1, out=self._get_scratch('tmp', shape))
+        np.cumsum(cs_dif, out=cs_dif)
 
         len1 = len(dist1)
         self.en = np.sqrt(len1/2)
-        stat = np.max(np.abs(cs1-cs2))
+        stat = np.max(np.abs(cs_dif, out=cs_dif)) / (n1 * n2)
         self.stat = stat
 
         return stat
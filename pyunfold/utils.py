@@ -99,3 +99,35 @@ def safe_inverse(x):
     inv[is_zero] = 0
 
     return inv
+
+
+def safe_divide(num, den):
+    """Safely divides the elements in num by the elements in den
+
+    Parameters
+    ----------
+    num : array_like
+        Input numerator array.
+    den : array_like
+        Input denominator array. Must be broadcastable with ``num``.
+
+    Returns
+    -------
+    quot : numpy.ndarray
+        Quotient of the input arrays (i.e. num / den) with elements where
+        den is zero set to zero.
+
+    Examples
+    --------
+    >>> num = [1, 2, 3, 4, 5]
+    >>> den = [1, 2, 0, 4, 0]
+    >>> safe_divide(num, den)
+    array([1., 1., 0., 1., 0.])
+    """
+    num = np.asarray(num)
+    den = np.asarray(den)
+    shape = np.broadcast(num, den).shape
+    quot = np.zeros(shape, dtype=np.result_type(num, den, float))
+    np.divide(num, den, out=quot, where=den != 0)
+
+    return quot